@@ -1,6 +1,7 @@
 import math
 import pygame
 import os
+import collections
 
 
 #### Goal Statement ####
@@ -29,6 +30,31 @@ MAX_FRAMES_PER_SECOND = 60
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 
+## Conservation diagnostics. Kinetic energy, momentum and centre of mass are only sampled every this-many game loop steps:
+DIAGNOSTICS_SAMPLE_EVERY_N_STEPS = 60
+## How many samples the ring buffer remembers before the oldest ones fall off the end:
+DIAGNOSTICS_RING_BUFFER_LENGTH = 600
+## Set this to a filename (like 'conservation_diagnostics.csv') to also stream every sample to a file. None means ring buffer only.
+DIAGNOSTICS_OUTPUT_FILENAME = None
+
+## Camera. Zoom is "screen pixels per playing field pixel", so 1.0 is the old fixed 1:1 view.
+## Each mouse wheel click or +/- keypress moves the zoom level up or down by one, and the zoom is CAMERA_ZOOM_STEP_MULTIPLIER ** zoom level:
+CAMERA_ZOOM_STEP_MULTIPLIER = 1.25
+## 1.25 ** -13 is about 0.055, and 1.25 ** 9 is about 7.5
+CAMERA_MINIMUM_ZOOM_LEVEL = -13
+CAMERA_MAXIMUM_ZOOM_LEVEL = 9
+## How many screen pixels the arrow keys pan the view per frame:
+CAMERA_PAN_SPEED_IN_SCREEN_PIXELS = 10
+## Level of detail. Below this zoom, sprites are too small to be worth scaling and blitting, so everything is drawn as density splats:
+CAMERA_MINIMUM_ZOOM_FOR_SPRITES = 0.35
+## The screen is split into square cells this many pixels across, for deciding what gets aggregated into a splat:
+DENSITY_SPLAT_CELL_SIZE_IN_PIXELS = 24
+## If more GravityWells than this land in one cell, the cell is drawn as one splat instead of lots of overlapping sprites:
+DENSITY_SPLAT_MAXIMUM_SPRITES_PER_CELL = 6
+DENSITY_SPLAT_COLOR = (180, 200, 255)
+## The old 1200x700 playing field gets outlined in this color, so there's something to steer by after panning and zooming:
+PLAYING_FIELD_OUTLINE_COLOR = (70, 70, 110)
+
 #### Classes ####
 
 
@@ -416,9 +442,386 @@ class PlayingField:
 				## I removed the 1-tile border.
 				self.draw_tile(self.list_full_of_reference_tile_surface_objects[tile_image_index_number], x, y)
 			
+
+class ConservationDiagnostics:
+	''' Keeps track of total energy, momentum, angular momentum, and centre of mass, so drift can be watched over long runs. '''
+	
+	## The expensive part of this is the potential energy, because it needs every pair of GravityWells. That is an O(N**2) pass all by itself!
+	## So instead of doing a second pass, calculate_gravity_and_adjust_velocities_on_all_gravity_wells() adds each pair's potential energy into this object while it is already working out the distances.
+	## Everything else (kinetic energy, momentum, centre of mass) is only O(N), and is read straight off the GravityWells once per sample.
+	
+	## NOTE: The force pass does NOT divide by mass (no inertia yet, see the notes in main()). Each pair changes the OTHER GravityWell's velocity by m1 * m2 / r**2, and the two halves of every pair point in opposite directions.
+	## That means the "textbook" numbers (sum of m * v, sum of 1/2 * m * v**2) would change every single step even if the movement math was perfect, and any real drift would get buried.
+	## So everything here is measured the way this program actually moves things, as if every GravityWell had a mass of 1 for inertia purposes:
+	## - - momentum is the plain sum of all the velocities, which the force pass conserves exactly
+	## - - angular momentum is the sum of (x * y_velocity - y * x_velocity), around the screen's upperleft corner (0, 0)
+	## - - kinetic energy is the sum of 1/2 * velocity**2, and total energy is that plus the usual -(m1 * m2) / r potential energy
+	## - - centre of mass is the plain average of all the locations, so it should move at (x_momentum, y_momentum) / the number of GravityWells
+	## The force pass never changes momentum or angular momentum, so anything those do over time is drift from the movement code (like the velocity buffers in GravityWell.update()).
+	## Total energy also picks up a little drift from the force pass itself, since it divides the direction by (abs(sine) + abs(cosine)) instead of using a unit vector, which makes diagonal pulls a bit weaker than the potential energy says they should be.
+	
+	## Immobile GravityWells still get their velocities adjusted by the force pass, they just never move.
+	## That velocity is momentum they absorbed from everything else, so it IS counted in momentum and angular momentum. Otherwise the fixed planet in main() would make both of them drift every step.
+	## It is NOT counted in kinetic energy, because nothing is actually moving.
+	## For the same reason, the centre of mass doesn't carry an immobile GravityWell's share of the momentum along with it, so expect it to wander off from (momentum / number of GravityWells) whenever there is one.
+	
+	def __init__(self, sample_every_n_steps=DIAGNOSTICS_SAMPLE_EVERY_N_STEPS, ring_buffer_length=DIAGNOSTICS_RING_BUFFER_LENGTH, output_filename=DIAGNOSTICS_OUTPUT_FILENAME):
+		
+		self.sample_every_n_steps = max(1, int(sample_every_n_steps))
+		
+		## A deque with a maxlen is a ring buffer: appending to a full one silently drops the oldest sample.
+		self.ring_buffer_of_samples = collections.deque(maxlen=ring_buffer_length)
+		
+		self.output_filename = output_filename
+		
+		self.current_step_number = 0
+		self.is_sampling_this_step = False
+		self.potential_energy_accumulator = 0.0
+		
+		## Remember the first sample so everything after it can be compared against it.
+		self.first_sample = None
+		
+		## Start the file off with a header line, so it can be opened in a spreadsheet.
+		if self.output_filename is not None:
+			with open(self.output_filename, 'w') as output_file:
+				output_file.write('step,kinetic_energy,potential_energy,total_energy,x_momentum,y_momentum,angular_momentum,center_of_mass_x,center_of_mass_y\n')
+	
+	
+	def begin_step(self):
+		''' Advance the step counter and decide whether this step gets sampled. Call this BEFORE the force pass. '''
+		
+		self.is_sampling_this_step = ((self.current_step_number % self.sample_every_n_steps) == 0)
+		self.potential_energy_accumulator = 0.0
+		self.current_step_number += 1
+	
+	
+	def add_pair_potential_energy(self, first_mass, second_mass, distance_between_them):
+		''' Add one ordered pair's share of the potential energy. Called from inside the force pass. '''
+		
+		## The force pass visits every pair twice (A on B, then B on A), so each visit only counts for half of -(m1 * m2) / r
+		self.potential_energy_accumulator -= (0.5 * first_mass * second_mass) / distance_between_them
+	
+	
+	def finish_step(self, supplied_group_of_all_gravity_wells):
+		''' If this step is being sampled, read the O(N) terms off the GravityWells and record a sample. Call this AFTER the force pass but BEFORE update(), so the positions match the ones the potential energy was gathered at. Returns the sample, or None. '''
+		
+		if not self.is_sampling_this_step:
+			return None
+		
+		number_of_gravity_wells = 0
+		kinetic_energy = 0.0
+		x_momentum = 0.0
+		y_momentum = 0.0
+		angular_momentum = 0.0
+		x_position_sum = 0.0
+		y_position_sum = 0.0
+		
+		for each_gravity_well_object in supplied_group_of_all_gravity_wells:
+			
+			x_position = each_gravity_well_object.floating_point_rect_centerx
+			y_position = each_gravity_well_object.floating_point_rect_centery
+			x_velocity = each_gravity_well_object.current_x_velocity
+			y_velocity = each_gravity_well_object.current_y_velocity
+			
+			## No mass in any of these, see the NOTE at the top of the class.
+			number_of_gravity_wells += 1
+			x_position_sum += x_position
+			y_position_sum += y_position
+			
+			x_momentum += x_velocity
+			y_momentum += y_velocity
+			## It's a 2D cross product: r x v
+			angular_momentum += (x_position * y_velocity) - (y_position * x_velocity)
+			
+			## Immobile GravityWells don't move, so they have no kinetic energy no matter what their velocity says.
+			if not each_gravity_well_object.is_immobile:
+				kinetic_energy += 0.5 * ((x_velocity ** 2) + (y_velocity ** 2))
+		
+		if number_of_gravity_wells != 0:
+			center_of_mass_x = x_position_sum / number_of_gravity_wells
+			center_of_mass_y = y_position_sum / number_of_gravity_wells
+		else:
+			center_of_mass_x = 0.0
+			center_of_mass_y = 0.0
+		
+		sample = {	'step': self.current_step_number - 1,
+					'kinetic_energy': kinetic_energy,
+					'potential_energy': self.potential_energy_accumulator,
+					'total_energy': kinetic_energy + self.potential_energy_accumulator,
+					'x_momentum': x_momentum,
+					'y_momentum': y_momentum,
+					'angular_momentum': angular_momentum,
+					'center_of_mass_x': center_of_mass_x,
+					'center_of_mass_y': center_of_mass_y	}
+		
+		self.ring_buffer_of_samples.append(sample)
+		
+		if self.first_sample is None:
+			self.first_sample = sample
+		
+		if self.output_filename is not None:
+			with open(self.output_filename, 'a') as output_file:
+				output_file.write(','.join([str(sample['step']), repr(sample['kinetic_energy']), repr(sample['potential_energy']), repr(sample['total_energy']), repr(sample['x_momentum']), repr(sample['y_momentum']), repr(sample['angular_momentum']), repr(sample['center_of_mass_x']), repr(sample['center_of_mass_y'])]) + '\n')
+		
+		return sample
+	
+	
+	def get_total_energy_drift(self):
+		''' Return how far the total energy has drifted from the first sample to the latest one. '''
+		
+		if not self.ring_buffer_of_samples:
+			return 0.0
+		
+		return self.ring_buffer_of_samples[-1]['total_energy'] - self.first_sample['total_energy']
+	
+	
+	def get_summary_text(self):
+		''' Return a short line describing the latest sample and how far the total energy has drifted since the first one. Short enough for the window caption. '''
+		
+		if not self.ring_buffer_of_samples:
+			return 'no diagnostics samples yet'
+		
+		latest_sample = self.ring_buffer_of_samples[-1]
+		
+		return 'step %d | E %.4g (drift %+.3g) | p (%.3g, %.3g) | L %.4g' % (latest_sample['step'], latest_sample['total_energy'], self.get_total_energy_drift(), latest_sample['x_momentum'], latest_sample['y_momentum'], latest_sample['angular_momentum'])
+
+
+class Camera:
+	''' A zoomable, pannable view of the playing field. Only draws the GravityWells that are actually on screen. '''
+	
+	## Before this, every sprite got drawn at 1:1 scale through RenderUpdates(), even the ones that had drifted way off the screen.
+	## Now the Camera works out which part of the playing field is visible, skips (culls) everything outside of it, and draws the rest.
+	## GravityWells still store their locations in playing field ("world") pixels. The Camera only changes where they get drawn.
+	
+	## Level of detail:
+	## The visible GravityWells are sorted into a grid of screen cells. A cell gets drawn as a single density splat instead of sprites if
+	## - - the zoom is so far out that sprites would just be specks, OR
+	## - - too many GravityWells are piled up in that one cell.
+	## That way the drawing cost depends on how much detail is visible, not on how many GravityWells exist.
+	
+	## NOTE: The star tiles stay put on the screen on purpose, like a far-off sky. The outline of the playing field is what moves and scales with the Camera.
+	
+	def __init__(self, supplied_screen_rectangle):
+	
+		self.screen_rectangle = pygame.Rect(supplied_screen_rectangle)
+		
+		## The playing field location that shows up at the screen's upperleft corner:
+		self.world_x_offset = 0.0
+		self.world_y_offset = 0.0
+		
+		## The zoom is always worked out fresh from a whole-number zoom level, instead of being multiplied over and over.
+		## Multiplying floats back and forth leaves tiny leftovers (like 1.0000000000000007), and then the 1:1 view could never be hit exactly again.
+		self.zoom_level = 0
+		self.zoom = 1.0
+		
+		## At 1:1 the screen IS the playing field, so that's the area that gets outlined.
+		self.playing_field_world_rectangle = pygame.Rect(supplied_screen_rectangle)
+		
+		## Scaling a Surface every frame is slow, so remember the scaled versions. Keyed by (id of the original image, scaled size).
+		## Only the current zoom ever gets drawn, so this is emptied every time the zoom changes.
+		self.dictionary_of_scaled_images = {}
+		
+		## The background with the playing field outline drawn on it for the current view. Rebuilt on every full redraw.
+		self.view_background_surface = None
+		
+		## The Camera does its own dirty rectangle bookkeeping, since RenderUpdates() doesn't know about zoom or pan.
+		self.list_of_rectangles_drawn_last_frame = []
+		
+		## Moving the camera moves EVERYTHING on screen, so the next draw has to redraw the whole screen.
+		self.needs_full_redraw = True
+		
+	
+	def world_to_screen(self, world_x, world_y):
+		''' Convert a playing field location to a screen location. Returns floats. '''
+		
+		return ((world_x - self.world_x_offset) * self.zoom), ((world_y - self.world_y_offset) * self.zoom)
+		
+	
+	def screen_to_world(self, screen_x, screen_y):
+		''' Convert a screen location to a playing field location. Returns floats. '''
+		
+		return ((screen_x / self.zoom) + self.world_x_offset), ((screen_y / self.zoom) + self.world_y_offset)
+		
+	
+	def get_visible_world_rectangle(self):
+		''' Return a pygame.Rect() of the part of the playing field that is currently on screen. '''
+		
+		## Inflate by one pixel all round, because pygame.Rect() only does ints and we don't want to cull something that is just barely visible.
+		return pygame.Rect(int(self.world_x_offset), int(self.world_y_offset), int(self.screen_rectangle.width / self.zoom) + 1, int(self.screen_rectangle.height / self.zoom) + 1).inflate(2, 2)
+		
+	
+	def pan_by_screen_pixels(self, screen_x_change, screen_y_change):
+		''' Move the view. Positive numbers move the view right and down, so things on screen appear to move left and up. '''
+		
+		if screen_x_change == 0 and screen_y_change == 0:
+			return
+		
+		self.world_x_offset += screen_x_change / self.zoom
+		self.world_y_offset += screen_y_change / self.zoom
+		self.needs_full_redraw = True
+		
+	
+	def set_zoom_level(self, supplied_zoom_level):
+		''' Clamp supplied_zoom_level to the allowed range and set the zoom from it. Returns True if the zoom actually changed. '''
+		
+		new_zoom_level = min(max(supplied_zoom_level, CAMERA_MINIMUM_ZOOM_LEVEL), CAMERA_MAXIMUM_ZOOM_LEVEL)
+		
+		## Already all the way in or out (or not moving at all), so there's nothing to redo.
+		if new_zoom_level == self.zoom_level:
+			return False
+		
+		self.zoom_level = new_zoom_level
+		self.zoom = CAMERA_ZOOM_STEP_MULTIPLIER ** self.zoom_level
+		
+		## Only the current zoom ever gets drawn, so the old scaled images are useless now.
+		self.dictionary_of_scaled_images.clear()
+		self.needs_full_redraw = True
+		
+		return True
+		
+	
+	def zoom_around_screen_point(self, zoom_level_change, supplied_screen_point):
+		''' Zoom in (positive zoom_level_change) or out (negative) while keeping the playing field location under supplied_screen_point in the same place on screen. '''
+		
+		## Remember where the point is in the world before zooming...
+		world_x_under_point, world_y_under_point = self.screen_to_world(supplied_screen_point[0], supplied_screen_point[1])
+		
+		if not self.set_zoom_level(self.zoom_level + zoom_level_change):
+			return
+		
+		## ... then slide the view so that world location is back under the point.
+		self.world_x_offset = world_x_under_point - (supplied_screen_point[0] / self.zoom)
+		self.world_y_offset = world_y_under_point - (supplied_screen_point[1] / self.zoom)
+		
+	
+	def reset_view(self):
+		''' Go back to the old fixed 1:1 view of the playing field. '''
+		
+		self.set_zoom_level(0)
+		self.world_x_offset = 0.0
+		self.world_y_offset = 0.0
+		self.needs_full_redraw = True
+		
+	
+	def get_scaled_image(self, supplied_image):
+		''' Return supplied_image scaled to the current zoom, reusing an earlier scaling if there is one. '''
+		
+		if self.zoom == 1.0:
+			return supplied_image
+		
+		scaled_size = (max(1, int(supplied_image.get_width() * self.zoom)), max(1, int(supplied_image.get_height() * self.zoom)))
+		dictionary_key = (id(supplied_image), scaled_size)
+		
+		if dictionary_key not in self.dictionary_of_scaled_images:
+			scaled_image = pygame.transform.scale(supplied_image, scaled_size)
+			## Carry the transparency over to the scaled copy, the same way Planet sets it up.
+			if supplied_image.get_colorkey() is not None:
+				scaled_image.set_colorkey(supplied_image.get_colorkey(), pygame.RLEACCEL)
+			## Keep the original in here too. As long as it's alive, Python can't hand its id() to some other image and get the wrong scaled copy back.
+			self.dictionary_of_scaled_images[dictionary_key] = (supplied_image, scaled_image)
+		
+		return self.dictionary_of_scaled_images[dictionary_key][1]
+		
+	
+	def make_view_background(self, supplied_background_surface):
+		''' Copy the background and draw the playing field outline on it where the Camera currently sees it. '''
+		
+		self.view_background_surface = supplied_background_surface.copy()
+		
+		outline_left, outline_top = self.world_to_screen(self.playing_field_world_rectangle.left, self.playing_field_world_rectangle.top)
+		outline_right, outline_bottom = self.world_to_screen(self.playing_field_world_rectangle.right, self.playing_field_world_rectangle.bottom)
+		
+		## Floored like everything else the Camera draws, so the outline and the sprites agree about which pixel is which.
+		outline_screen_rectangle = pygame.Rect(math.floor(outline_left), math.floor(outline_top), math.floor(outline_right) - math.floor(outline_left), math.floor(outline_bottom) - math.floor(outline_top))
+		pygame.draw.rect(self.view_background_surface, PLAYING_FIELD_OUTLINE_COLOR, outline_screen_rectangle, 1)
+		
+	
+	def draw_visible_gravity_wells(self, screen, supplied_background_surface, supplied_group_of_all_gravity_wells):
+		''' Clear the last frame, then draw every on-screen GravityWell as either a sprite or part of a density splat. Returns the list of dirty rectangles for pygame.display.update() '''
+		
+		## Step one: Clear.
+		## Clearing uses the view background (the one with the outline on it), otherwise sprites would erase bits of the outline as they pass over it.
+		if self.needs_full_redraw:
+			self.make_view_background(supplied_background_surface)
+			screen.blit(self.view_background_surface, (0, 0))
+		else:
+			for each_old_rectangle in self.list_of_rectangles_drawn_last_frame:
+				screen.blit(self.view_background_surface, each_old_rectangle, each_old_rectangle)
+		
+		## Step two: Cull, and sort whatever's left into the density grid.
+		visible_world_rectangle = self.get_visible_world_rectangle()
+		dictionary_of_density_cells = {}
+		
+		for each_gravity_well_object in supplied_group_of_all_gravity_wells:
+			
+			if not visible_world_rectangle.colliderect(each_gravity_well_object.rect):
+				continue
+			
+			screen_x, screen_y = self.world_to_screen(each_gravity_well_object.floating_point_rect_centerx, each_gravity_well_object.floating_point_rect_centery)
+			density_cell_key = (int(screen_x // DENSITY_SPLAT_CELL_SIZE_IN_PIXELS), int(screen_y // DENSITY_SPLAT_CELL_SIZE_IN_PIXELS))
+			dictionary_of_density_cells.setdefault(density_cell_key, []).append((each_gravity_well_object, screen_x, screen_y))
+		
+		## Step three: Draw.
+		list_of_rectangles_drawn_this_frame = []
+		is_zoomed_too_far_out_for_sprites = (self.zoom < CAMERA_MINIMUM_ZOOM_FOR_SPRITES)
+		
+		for each_list_of_cell_contents in dictionary_of_density_cells.values():
+			
+			if is_zoomed_too_far_out_for_sprites or (len(each_list_of_cell_contents) > DENSITY_SPLAT_MAXIMUM_SPRITES_PER_CELL):
+				list_of_rectangles_drawn_this_frame.append(self.draw_density_splat(screen, each_list_of_cell_contents))
+			
+			else:
+				for each_gravity_well_object, screen_x, screen_y in each_list_of_cell_contents:
+					scaled_image = self.get_scaled_image(each_gravity_well_object.image)
+					scaled_image_rectangle = scaled_image.get_rect()
+					## math.floor(), not int(), so things hanging off the left or top edge don't get nudged a pixel towards the middle.
+					scaled_image_rectangle.center = (math.floor(screen_x), math.floor(screen_y))
+					list_of_rectangles_drawn_this_frame.append(screen.blit(scaled_image, scaled_image_rectangle))
+		
+		## Step four: Figure out what pygame.display.update() needs to redraw.
+		if self.needs_full_redraw:
+			dirty_rectangles = [self.screen_rectangle]
+			self.needs_full_redraw = False
+		else:
+			dirty_rectangles = self.list_of_rectangles_drawn_last_frame + list_of_rectangles_drawn_this_frame
+		
+		self.list_of_rectangles_drawn_last_frame = list_of_rectangles_drawn_this_frame
+		
+		return dirty_rectangles
+		
+	
+	def draw_density_splat(self, screen, supplied_list_of_cell_contents):
+		''' Draw a whole density cell's worth of GravityWells as one soft dot at their centre of mass. Returns the dirty rectangle. '''
+		
+		total_mass = 0.0
+		mass_weighted_x_sum = 0.0
+		mass_weighted_y_sum = 0.0
+		
+		for each_gravity_well_object, screen_x, screen_y in supplied_list_of_cell_contents:
+			total_mass += each_gravity_well_object.current_mass
+			mass_weighted_x_sum += each_gravity_well_object.current_mass * screen_x
+			mass_weighted_y_sum += each_gravity_well_object.current_mass * screen_y
+		
+		## Weightless things still need to be drawn somewhere, so fall back to the plain average location.
+		if total_mass > 0.0:
+			splat_center = (math.floor(mass_weighted_x_sum / total_mass), math.floor(mass_weighted_y_sum / total_mass))
+		else:
+			splat_center = (math.floor(sum(each_entry[1] for each_entry in supplied_list_of_cell_contents) / len(supplied_list_of_cell_contents)), math.floor(sum(each_entry[2] for each_entry in supplied_list_of_cell_contents) / len(supplied_list_of_cell_contents)))
+		
+		## Bigger piles make bigger splats, but never bigger than the cell they stand for.
+		splat_radius = min(max(2, int(math.sqrt(len(supplied_list_of_cell_contents)) * 2)), DENSITY_SPLAT_CELL_SIZE_IN_PIXELS // 2)
+		
+		## pygame.draw.circle() hands back the rectangle it drew in, which is exactly the dirty rectangle.
+		return pygame.draw.circle(screen, DENSITY_SPLAT_COLOR, splat_center, splat_radius)
+		
+		
 #### Functions ####
 
-def calculate_gravity_and_adjust_velocities_on_all_gravity_wells(supplied_group_of_all_gravity_wells):
+def calculate_gravity_and_adjust_velocities_on_all_gravity_wells(supplied_group_of_all_gravity_wells, supplied_conservation_diagnostics_object=None):
+
+	## Only gather potential energy on steps the diagnostics object is actually sampling. Check it once here instead of once per pair.
+	is_gathering_potential_energy = (supplied_conservation_diagnostics_object is not None) and supplied_conservation_diagnostics_object.is_sampling_this_step
+
 	for each_gravity_well_object in supplied_group_of_all_gravity_wells:
 		for each_other_object in supplied_group_of_all_gravity_wells:
 		
@@ -448,6 +851,10 @@ def calculate_gravity_and_adjust_velocities_on_all_gravity_wells(supplied_group_
 				
 				#print("distance_between_these_two_objects_as_a_hypotenuse == " + str(distance_between_these_two_objects_as_a_hypotenuse) + "\n")
 				
+				## The distance is already paid for, so the potential energy for this pair is almost free:
+				if is_gathering_potential_energy:
+					supplied_conservation_diagnostics_object.add_pair_potential_energy(each_gravity_well_object.current_mass, each_other_object.current_mass, distance_between_these_two_objects_as_a_hypotenuse)
+				
 				
 				
 				## Dummy code:
@@ -580,7 +987,7 @@ def main():
 	## This section is intended to be temporary while I get the game figured out.
 	## Though it might end up being efficient to keep nearly all of the PlayingField code anyways.
 	
-	## Put it up on the screen even before the first RenderUpdates() call:
+	## Put it up on the screen even before the first draw:
 	screen.blit(the_playing_field_object.playing_field_background_surface_object, (0, 0))		# See the Arena class for details on the first parameter. The second is the upperleft alignment with the screen Surface() object's upperleft; the border-tweaking math comes after this in code execution and is not directly reflected in this particular pair of zeroes.
 	pygame.display.update()
 	
@@ -592,6 +999,7 @@ def main():
 	## First make the Groups.
 	
 	## RenderUpdates() is special to pygame's sprite handling.
+	## ((  The Camera does the actual drawing now, since RenderUpdates() only knows how to draw at 1:1. It's still what update()s everything.  ))
 	group_of_all_sprites = pygame.sprite.RenderUpdates()
 	
 	## Group()s are for various iterations and assignments not native to pygame.
@@ -614,6 +1022,16 @@ def main():
 	## Initialize the clock object, used to cap the framerate / to meter the program's temporal progression.
 	clock = pygame.time.Clock()
 	
+	
+	##~~ Keep track of conservation ~~##
+	## Watches energy, momentum and centre of mass drift without a second O(N**2) pass. See the ConservationDiagnostics class.
+	the_conservation_diagnostics_object = ConservationDiagnostics()
+	
+	
+	##~~ Keep track of the view ~~##
+	## Arrow keys pan, the mouse wheel or +/- zooms, dragging with the right mouse button pans, and Home goes back to the normal view.
+	the_camera_object = Camera(SCREEN_BOUNDARY_RECTANGLE)
+	
 
 
 	##~~ The Game Loop ~~##
@@ -631,6 +1049,29 @@ def main():
 				or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
 					## hitting the esc key --^
 					return	
+			
+			## Mouse wheel zooming. Buttons 4 and 5 are the wheel going up and down.
+			elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 4:
+				the_camera_object.zoom_around_screen_point(1, event.pos)
+			elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 5:
+				the_camera_object.zoom_around_screen_point(-1, event.pos)
+				
+			## Right-click dragging. Dragging the mouse right should drag the playing field right, so pan the opposite way.
+			elif event.type == pygame.MOUSEMOTION and event.buttons[2]:
+				the_camera_object.pan_by_screen_pixels(-event.rel[0], -event.rel[1])
+			
+			## Keyboard zooming is centred on the middle of the screen.
+			elif event.type == pygame.KEYDOWN and event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+				the_camera_object.zoom_around_screen_point(1, SCREEN_BOUNDARY_RECTANGLE.center)
+			elif event.type == pygame.KEYDOWN and event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+				the_camera_object.zoom_around_screen_point(-1, SCREEN_BOUNDARY_RECTANGLE.center)
+			elif event.type == pygame.KEYDOWN and event.key == pygame.K_HOME:
+				the_camera_object.reset_view()
+		
+		## Arrow key panning happens every frame the key is held down, so it uses get_pressed() instead of events.
+		keys_currently_pressed = pygame.key.get_pressed()
+		the_camera_object.pan_by_screen_pixels(	(keys_currently_pressed[pygame.K_RIGHT] - keys_currently_pressed[pygame.K_LEFT]) * CAMERA_PAN_SPEED_IN_SCREEN_PIXELS,
+												(keys_currently_pressed[pygame.K_DOWN] - keys_currently_pressed[pygame.K_UP]) * CAMERA_PAN_SPEED_IN_SCREEN_PIXELS	)
 					
 		
 		if not group_of_planets:
@@ -645,18 +1086,21 @@ def main():
 			
 				
 		#~ Clear sprites ~#
-		## NOTE: The playing_field_background_surface_object should just be a giant black surface equal to the size of the screen, for now.
-		
-		
-		group_of_all_sprites.clear(screen, the_playing_field_object.playing_field_background_surface_object)
-
-		
+		## Clearing happens inside the Camera's draw now, right before it redraws. See below.
 		
 		
 		#~ Update ~#
 
+		## Step zero: Tell the diagnostics a new step is starting.
+		the_conservation_diagnostics_object.begin_step()
+		
 		## Step one: The Gravitationating.
-		calculate_gravity_and_adjust_velocities_on_all_gravity_wells(group_of_gravity_wells)
+		calculate_gravity_and_adjust_velocities_on_all_gravity_wells(group_of_gravity_wells, the_conservation_diagnostics_object)
+		
+		## Step one and a half: Sample kinetic energy and momentum, before anything moves.
+		## Whenever there's a new sample, show it in the window caption so the drift can be watched while it runs.
+		if the_conservation_diagnostics_object.finish_step(group_of_gravity_wells) is not None:
+			pygame.display.set_caption(WINDOW_CAPTION + ' -- ' + the_conservation_diagnostics_object.get_summary_text())
 				
 		## Step two: Rendermoving.
 		group_of_all_sprites.update()
@@ -664,8 +1108,10 @@ def main():
 	
 		#~ Redraw ~#
 		## "Dirty" rectangles are when you only update things that changed, rather than the entire screen. These are the regions that have to be redrawn.
+		## The Camera clears the old spots, skips everything off screen, and draws the rest as sprites or density splats.
+		## NOTE: The playing_field_background_surface_object should just be a giant black surface equal to the size of the screen, for now.
 		##              [...]                     v--- Returns a list of the regions which changed since the last update()
-		dirty_rectangles = group_of_all_sprites.draw(screen)
+		dirty_rectangles = the_camera_object.draw_visible_gravity_wells(screen, the_playing_field_object.playing_field_background_surface_object, group_of_gravity_wells)
 		## Once we have the changed regions, we can update specifically those:
 		pygame.display.update(dirty_rectangles)
 		